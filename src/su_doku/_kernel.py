@@ -0,0 +1,186 @@
+"""
+Compiled kernels for the hot loops of the solver.
+These work on the flat ``uint8`` grid and the ``uint64`` bitmasks of a
+:class:`~su_doku.Sudoku`, which are packed into one array holding the masks
+of the N rows, then the N columns, then the N boxes.
+They are compiled with Numba when it is installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import config, njit
+
+    NUMBA_AVAILABLE = not config.DISABLE_JIT  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """
+        Stand-in for ``numba.njit`` that leaves the function as plain Python.
+        """
+        return lambda func: func
+
+
+@njit(cache=True)
+def _seed_njit(seed):
+    """
+    Seeds the random number generator used by the compiled kernels,
+    which is separate from NumPy's own when Numba is installed.
+    """
+    np.random.seed(seed)
+
+
+@njit(cache=True, nogil=True)
+def _bit_count(mask):
+    """
+    Counts the set bits of a bitmask.
+    """
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _random_digit(mask, n):
+    """
+    Picks one of the digits in a non-empty candidate bitmask at random.
+    """
+    k = np.random.randint(0, _bit_count(mask))
+    for digit in range(1, n + 1):
+        if (mask >> digit) & 1:
+            if k == 0:
+                return digit
+            k -= 1
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _place(grid, masks, n, box_idx, index, digit):
+    """
+    Writes a digit into an empty cell and marks it as used in the bitmasks.
+    """
+    row = index // n
+    col = index % n
+    bit = np.uint64(1) << np.uint64(digit)
+    grid[index] = digit
+    masks[row] |= bit
+    masks[n + col] |= bit
+    masks[2 * n + box_idx[index]] |= bit
+
+
+@njit(cache=True, nogil=True)
+def _unwind(grid, masks, n, box_idx, trail, filled, mark):
+    """
+    Empties the cells recorded on the trail after position ``mark``,
+    in reverse order, and returns the new length of the trail.
+    """
+    while filled > mark:
+        filled -= 1
+        index = trail[filled]
+        row = index // n
+        col = index % n
+        bit = np.uint64(1) << np.uint64(grid[index])
+        grid[index] = 0
+        masks[row] ^= bit
+        masks[n + col] ^= bit
+        masks[2 * n + box_idx[index]] ^= bit
+    return filled
+
+
+@njit(cache=True, nogil=True)
+def _propagate_njit(grid, masks, n, box_idx, trail, filled):
+    """
+    Fills in empty cells with a single candidate until none are left,
+    recording them on the trail, then finds the empty cell with the fewest
+    candidates.
+    Returns the new length of the trail, and the index of that cell with its
+    candidate bitmask; the index is ``-1`` if the grid is full, or ``-2`` if
+    an empty cell has no candidates.
+    """
+    full_mask = (2 << n) - 2
+    changed = True
+    while changed:
+        changed = False
+        index = -1
+        free = 0
+        fewest = n + 1
+        for i in range(n * n):
+            if grid[i] != 0:
+                continue
+            row = i // n
+            col = i % n
+            used = masks[row] | masks[n + col] | masks[2 * n + box_idx[i]]
+            mask = ~np.int64(used) & full_mask
+            if mask == 0:
+                return filled, -2, 0
+            if mask & (mask - 1) == 0:
+                digit = 0
+                while mask > 1:
+                    mask >>= 1
+                    digit += 1
+                _place(grid, masks, n, box_idx, i, digit)
+                trail[filled] = i
+                filled += 1
+                changed = True
+            elif not changed:
+                count = _bit_count(mask)
+                if count < fewest:
+                    index = i
+                    free = mask
+                    fewest = count
+    return filled, index, free
+
+
+@njit(cache=True, nogil=True)
+def _solve_njit(grid, masks, n, box_idx):
+    """
+    Solves the grid in-place by propagating naked singles and backtracking
+    on the most constrained cell, trying its candidates in random order.
+    The search keeps an explicit stack of branching cells with their untried
+    candidates, and a trail of every filled cell so that each branch can be
+    undone.
+    Returns whether a solution was found; on failure the grid is left unchanged.
+    """
+    size = n * n
+    trail = np.empty(size, dtype=np.int64)
+    cells = np.empty(size, dtype=np.int64)
+    untried = np.empty(size, dtype=np.int64)
+    marks = np.empty(size, dtype=np.int64)
+
+    filled, index, free = _propagate_njit(grid, masks, n, box_idx, trail, 0)
+    if index == -1:
+        return True
+
+    depth = -1
+    if index != -2:
+        depth = 0
+        cells[0] = index
+        untried[0] = free
+        marks[0] = filled
+
+    while depth >= 0:
+        filled = _unwind(grid, masks, n, box_idx, trail, filled, marks[depth])
+        if untried[depth] == 0:
+            depth -= 1
+            continue
+        digit = _random_digit(untried[depth], n)
+        untried[depth] ^= 1 << digit
+
+        _place(grid, masks, n, box_idx, cells[depth], digit)
+        trail[filled] = cells[depth]
+        filled, index, free = _propagate_njit(
+            grid, masks, n, box_idx, trail, filled + 1
+        )
+        if index == -1:
+            return True
+        if index != -2:
+            depth += 1
+            cells[depth] = index
+            untried[depth] = free
+            marks[depth] = filled
+
+    _unwind(grid, masks, n, box_idx, trail, filled, 0)
+    return False
@@ -1,32 +1,95 @@
 from __future__ import annotations
 
+import itertools
+import multiprocessing as mp
+import random
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from logging import getLogger
-from typing import Iterator, Optional, Sequence
+from math import isqrt
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event
+from typing import Callable, Iterator, Optional, Sequence
 
 import numpy as np
 
-from .typing import Array, Int, Matrix, NpInt, Unsigned
+from ._kernel import NUMBA_AVAILABLE, _seed_njit, _solve_njit
+from .typing import Array, CandMask, Int, Matrix, NpInt, Unsigned, WideCandMask
 
 logger = getLogger(__name__)
 
 
-class Sudoku(Matrix[Unsigned]):
+def _bits_of(mask: int) -> Iterator[int]:
     """
-    Sudoku generator and solver class, based on ``numpy.ndarray``.
+    Yields the positions of the set bits of a bitmask, from low to high.
     """
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
 
-    n: Unsigned
+
+@lru_cache
+def _peer_tables(n: int, sr: int) -> tuple[Matrix[np.intp], Array[np.intp], int]:
+    """
+    Builds the lookup tables shared by all N×N grids:
+    the indices of the peers of each cell, i.e. the other cells in its row,
+    column or box, the index of the box of each cell,
+    and the bitmask of all digits from 1 to N.
+    """
+    rows, cols = np.divmod(np.arange(n * n), n)
+    box_idx = rows // sr * sr + cols // sr
+    same_unit = (
+        (rows[:, None] == rows)
+        | (cols[:, None] == cols)
+        | (box_idx[:, None] == box_idx)
+    )
+    np.fill_diagonal(same_unit, False)
+    peers = np.nonzero(same_unit)[1].reshape(n * n, -1)
+    peers.flags.writeable = box_idx.flags.writeable = False
+    return peers, box_idx, (2 << n) - 2
+
+
+class Sudoku:
+    """
+    Sudoku generator and solver class.
+    The grid is stored row by row in a flat byte buffer,
+    alongside bitmasks of the digits used in each row, column and box.
+    """
+
+    __slots__ = (
+        "_buf",
+        "n",
+        "sr",
+        "_masks",
+        "_empty",
+        "_peers",
+        "_box_idx",
+        "_full_mask",
+        "_hash",
+    )
+
+    n: int
     """
     N is the number of rows and columns in the square grid.
     """
-    sr: Unsigned
+    sr: int
     """
     SR is the square root of N.
     """
-
-    def __new__(
-        cls, grid: Sequence[Sequence[Int]] | Matrix[NpInt], _verify: bool = True
+    _buf: bytearray
+    _masks: Array[np.uint64]
+    _empty: set[int]
+    _peers: Matrix[np.intp]
+    _box_idx: Array[np.intp]
+    _full_mask: int
+    _hash: Optional[int]
+
+    def __init__(
+        self,
+        grid: Sequence[Sequence[Int]] | Matrix[NpInt] | Sudoku,
+        _verify: bool = True,
     ):
         """
         Creates a new grid that represents a Sudoku game board.
@@ -34,21 +97,154 @@ class Sudoku(Matrix[Unsigned]):
         and require that the grid can be divided into square boxes,
         i.e., the grid size is N×N, where N is a perfect square.
         """
-        obj = np.array(grid, dtype=Unsigned, copy=True).view(cls)
+        array = np.array(grid, dtype=Unsigned)
 
-        obj.n = Unsigned(n := obj.shape[0])
-        obj.sr = round_sr = Unsigned(sr := np.sqrt(n))
+        self.n = n = array.shape[0]
+        self.sr = sr = isqrt(n)
 
         if _verify:
-            assert len(obj.shape) == 2, "Grid is not two-dimensional"
-            assert n == obj.shape[1], "Grid is not square"
-            assert sr == round_sr, "N is not a perfect square"
+            assert len(array.shape) == 2, "Grid is not two-dimensional"
+            assert n == array.shape[1], "Grid is not square"
+            assert sr * sr == n, "N is not a perfect square"
             assert np.logical_and(
-                0 <= obj, obj <= n
+                0 <= array, array <= n
             ).all(), "Grid contains invalid digits"
+            assert n < 64, "N is too large for the candidate bitmasks"
+
+        self._peers, self._box_idx, self._full_mask = _peer_tables(n, self.sr)
+        self._buf = bytearray(array.tobytes())
+        self._hash = None
+        self._build_state()
 
+    @classmethod
+    def _fast_copy(cls, src: Sudoku) -> Sudoku:
+        """
+        Copies a grid without going through ``__init__``,
+        sharing the lookup tables and duplicating only the mutable state.
+        """
+        obj = object.__new__(cls)
+        obj._buf = src._buf[:]
+        obj.n = src.n
+        obj.sr = src.sr
+        obj._masks = src._masks.copy()
+        obj._empty = src._empty.copy()
+        obj._peers = src._peers
+        obj._box_idx = src._box_idx
+        obj._full_mask = src._full_mask
+        obj._hash = src._hash
         return obj
 
+    def _build_state(self) -> None:
+        """
+        Rebuilds the row, column and box bitmasks and the set of empty cells
+        from the digits in the grid.
+        Bit D of a mask is set if digit D is already used in that unit.
+        The masks of the rows, the columns and the boxes share one array,
+        in that order.
+        """
+        self._masks = np.zeros(3 * self.n, dtype=np.uint64)
+        self._empty = set()
+        for index, digit in enumerate(self._buf):
+            if not digit:
+                self._empty.add(index)
+            else:
+                row, col = divmod(index, self.n)
+                bit = np.uint64(1 << digit)
+                self._masks[row] |= bit
+                self._masks[self.n + col] |= bit
+                self._masks[2 * self.n + self._box_idx[index]] |= bit
+
+    def _unit(self, i: Int) -> int:
+        """
+        Checks a row or column number, and wraps negative ones around
+        as NumPy does.
+        """
+        if not -self.n <= (i := int(i)) < self.n:
+            raise IndexError(f"Index {i} is out of the grid")
+        return i % self.n
+
+    def _index(self, row: Int, col: Int) -> int:
+        """
+        Returns the position of the given cell in the flat buffer.
+        """
+        return self._unit(row) * self.n + self._unit(col)
+
+    @staticmethod
+    def _is_cell(key: object) -> bool:
+        return (
+            isinstance(key, tuple)
+            and len(key) == 2
+            and all(isinstance(i, Int) for i in key)  # type: ignore
+        )
+
+    def __getitem__(self, key):
+        """
+        Returns the digit at a ``(row, col)`` position.
+        Any other key is applied to a copy of the grid as a NumPy array.
+        """
+        if self._is_cell(key):
+            return self._buf[self._index(*key)]
+        return self.to_numpy()[key]
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Places a digit at a ``(row, col)`` position,
+        keeping the bitmasks and the set of empty cells in sync.
+        Any other key is applied to the grid as a NumPy array.
+        Digits must be between 0 and N, or a :exc:`ValueError` is raised
+        and the grid is left as it was.
+        """
+        if not self._is_cell(key):
+            values = np.asarray(value)
+            if not np.logical_and(0 <= values, values <= self.n).all():
+                raise ValueError(f"Digits must be between 0 and {self.n}")
+            array = self.to_numpy()
+            array[key] = values
+            self._hash = None
+            self._buf[:] = array.tobytes()
+            return self._build_state()
+
+        n, sr = self.n, self.sr
+        index = self._index(*key)
+        if not 0 <= (new := int(value)) <= n:
+            raise ValueError(f"Digit {new} is not between 0 and {n}")
+        self._hash = None
+        row, col = divmod(index, n)
+        box = 2 * n + self._box_idx[index]
+        old = self._buf[index]
+        self._buf[index] = new
+        if old and old != new:
+            # The grid may hold the same digit twice in a unit,
+            # so only clear its bit once the last copy is gone.
+            if old not in self._buf[row * n : row * n + n]:
+                self._masks[row] ^= np.uint64(1 << old)
+            if old not in self._buf[col::n]:
+                self._masks[n + col] ^= np.uint64(1 << old)
+            top = row // sr * sr * n + col // sr * sr
+            if not any(
+                old in self._buf[start : start + sr]
+                for start in range(top, top + sr * n, n)
+            ):
+                self._masks[box] ^= np.uint64(1 << old)
+        if new:
+            bit = np.uint64(1 << new)
+            self._masks[row] |= bit
+            self._masks[self.n + col] |= bit
+            self._masks[box] |= bit
+            self._empty.discard(index)
+        else:
+            self._empty.add(index)
+
+    def to_numpy(self) -> Matrix[Unsigned]:
+        """
+        Returns a copy of the grid as an N×N NumPy array.
+        """
+        return np.frombuffer(self._buf, dtype=Unsigned).reshape(self.n, self.n).copy()
+
+    def __array__(self, dtype=None) -> Matrix[Unsigned]:
+        array = self.to_numpy()
+        return array if dtype is None else array.astype(dtype)
+
     @classmethod
     def empty(cls, n: Int):
         """
@@ -58,138 +254,247 @@ class Sudoku(Matrix[Unsigned]):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Sudoku):
-            return np.array_equal(self, other)
+            return self.n == other.n and self._buf == other._buf
+        else:
+            return self.to_numpy() == other
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Sudoku):
+            return not self == other
         else:
-            return super().__eq__(other)
+            return self.to_numpy() != other
+
+    def __len__(self) -> int:
+        return self.n
 
-    def __hash__(self) -> int:  # type: ignore
-        return hash((self.__class__, self.tobytes()))
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(bytes(self._buf))
+        return self._hash
 
     def is_safe(self, row: Int, col: Int, digit: Int) -> bool:
         """
         Checks if it is safe to place the given digit at the given position.
         """
-        return (
-            self.row_safe(row, digit)
-            and self.col_safe(col, digit)
-            and self.box_safe(row, col, digit)
+        return not (self.used_mask(row, col) >> int(digit)) & 1
+
+    def used_mask(self, row: Int, col: Int) -> int:
+        """
+        Returns the bitmask of digits already used in the row, column and box
+        of the given position.
+        """
+        row, col = divmod(index := self._index(row, col), self.n)
+        return int(
+            self._masks[row]
+            | self._masks[self.n + col]
+            | self._masks[2 * self.n + self._box_idx[index]]
         )
 
+    def box_index(self, row: Int, col: Int) -> int:
+        """
+        Returns the index of the box that contains the given position,
+        counting boxes from left to right and then from top to bottom.
+        """
+        return int(self._box_idx[self._index(row, col)])
+
     def box(self, row: Int, col: Int) -> Matrix[Unsigned]:
         """
         Returns the box that contains the given position.
         """
-        r = row // self.sr * self.sr
-        c = col // self.sr * self.sr
-        return self[r : r + self.sr, c : c + self.sr]
+        r = self._unit(row) // self.sr * self.sr
+        c = self._unit(col) // self.sr * self.sr
+        return self.to_numpy()[r : r + self.sr, c : c + self.sr]
 
     def row_safe(self, row: Int, digit: Int) -> bool:
         """
         Checks if it is safe to place the given digit at the given row.
         """
-        return digit not in self[row, :]
+        return not (int(self._masks[self._unit(row)]) >> int(digit)) & 1
 
     def col_safe(self, col: Int, digit: Int) -> bool:
         """
         Checks if it is safe to place the given digit at the given column.
         """
-        return digit not in self[:, col]
+        return not (int(self._masks[self.n + self._unit(col)]) >> int(digit)) & 1
 
     def box_safe(self, row: Int, col: Int, digit: Int) -> bool:
         """
         Checks if it is safe to place the given digit at the given box.
         """
-        return digit not in self.box(row, col)
+        mask = int(self._masks[2 * self.n + self.box_index(row, col)])
+        return not (mask >> int(digit)) & 1
 
     @property
-    def empty_cells(self) -> Iterator[tuple[Unsigned, Unsigned]]:
+    def empty_cells(self) -> Iterator[tuple[int, int]]:
         """
         Returns an iterator over all empty cells in the grid.
         """
-        for row, col in np.argwhere(self == 0):
-            yield row, col
+        for index in sorted(self._empty):
+            yield divmod(index, self.n)
 
-    def find_empty(self) -> Optional[tuple[Unsigned, Unsigned]]:
+    def find_empty(self) -> Optional[tuple[int, int]]:
         """
         Finds one empty cell in the grid.
         """
-        return next(self.empty_cells, None)
+        if (index := next(iter(self._empty), None)) is None:
+            return None
+        return divmod(index, self.n)
 
-    def candidates(self, row: Int, col: Int) -> Iterator[Unsigned]:
+    def find_most_constrained(self) -> Optional[tuple[int, int, int]]:
         """
-        Returns a generator of possible candidates for the given position.
+        Finds the empty cell with the fewest candidates,
+        and returns its position together with its candidate bitmask.
         """
-        return (
-            candidate
-            for candidate in np.arange(1, self.n + 1, dtype=Unsigned)
-            if self.is_safe(row, col, candidate)
+        return self._most_constrained(self._candidate_masks())
+
+    def _candidate_masks(self) -> Array[np.unsignedinteger]:
+        """
+        Returns the candidate bitmask of every cell, which is zero for the
+        cells that are already filled.
+        """
+        n = self.n
+        cand: Array[np.unsignedinteger] = np.zeros(
+            n * n, dtype=CandMask if n < 16 else WideCandMask
         )
+        empty = np.fromiter(self._empty, dtype=np.intp, count=len(self._empty))
+        rows, cols = np.divmod(empty, n)
+        used = self._masks[rows] | self._masks[n + cols]
+        used |= self._masks[2 * n + self._box_idx[empty]]
+        cand[empty] = ~used & self._full_mask
+        return cand
+
+    def _most_constrained(
+        self, cand: Array[np.unsignedinteger]
+    ) -> Optional[tuple[int, int, int]]:
+        """
+        Picks the empty cell with the fewest candidates out of the given
+        candidate bitmasks, by counting their bits all at once.
+        """
+        if not self._empty:
+            return None
+        empty = np.fromiter(sorted(self._empty), dtype=np.intp)
+        masks = cand[empty]
+        counts = np.unpackbits(masks.view(np.uint8).reshape(len(masks), -1), axis=1)
+        index = int(empty[counts.sum(axis=1).argmin()])
+        return *divmod(index, self.n), int(cand[index])
+
+    def candidates(self, row: Int, col: Int) -> Iterator[int]:
+        """
+        Returns a generator of possible candidates for the given position.
+        """
+        return _bits_of(~self.used_mask(row, col) & self._full_mask)
 
-    def random_candidates(self, row: Int, col: Int) -> Array[Unsigned]:
+    def random_candidates(self, row: Int, col: Int) -> list[int]:
         """
-        Returns an array of possible candidates for the given position.
+        Returns a list of possible candidates for the given position,
+        in random order.
         """
-        candidates = np.asarray(tuple(self.candidates(row, col)))
-        np.random.shuffle(candidates)
+        candidates = list(self.candidates(row, col))
+        random.shuffle(candidates)
         return candidates
 
     def solve(self) -> Optional[Sudoku]:
         """
         Solves the Sudoku puzzle.
         """
-        return Sudoku(self, _verify=False).solve_inplace()
+        return Sudoku._fast_copy(self).solve_inplace()
 
     def solve_inplace(self) -> Optional[Sudoku]:
         """
         Solves the Sudoku puzzle in-place.
-        """
-        if (empty_cell := self.find_empty()) is None:
+        The kernel is seeded from NumPy's global random state,
+        so ``np.random.seed`` makes the result reproducible.
+        """
+        if NUMBA_AVAILABLE:
+            _seed_njit(np.random.randint(2**31))
+        grid = np.frombuffer(self._buf, dtype=Unsigned)
+        if _solve_njit(grid, self._masks, self.n, self._box_idx):
+            self._empty.clear()
+            self._hash = None
             return self
-        for candidate in self.random_candidates(*empty_cell):
-            self[empty_cell] = candidate
-            if (solution := self.solve_inplace()) is not None:
-                return solution
-        self[empty_cell] = 0
         return None
 
+    def _propagate(self) -> tuple[bool, Optional[tuple[int, int, int]]]:
+        """
+        Fills in every empty cell that has only one candidate,
+        repeating until no such cell is left.
+        Returns ``False`` if an empty cell runs out of candidates,
+        and otherwise ``True`` together with the most constrained cell
+        that is still empty, as :meth:`find_most_constrained` does,
+        or ``None`` if the grid is full.
+        """
+        n = self.n
+        cand = self._candidate_masks()
+        empty = np.flatnonzero(cand)
+        if len(empty) < len(self._empty):
+            return False, None
+        singles = deque(empty[cand[empty] & (cand[empty] - 1) == 0].tolist())
+
+        while singles:
+            if self._buf[index := singles.popleft()]:
+                continue
+            if not (bit := int(cand[index])):
+                return False, None
+            self[divmod(index, n)] = bit.bit_length() - 1
+            cand[index] = 0
+
+            peers = self._peers[index]
+            peers = peers[cand[peers] & bit != 0]
+            cand[peers] ^= bit
+            singles.extend(peers[cand[peers] & (cand[peers] - 1) == 0].tolist())
+        return True, self._most_constrained(cand)
+
     def solve_all(self) -> frozenset[Sudoku]:
         """
         Returns a set of all possible solutions to the Sudoku puzzle.
         """
         s: set[Sudoku] = set()
-        self._solve_all_helper(s)
+        Sudoku._fast_copy(self)._solve_all_helper(s)
         return frozenset(s)
 
     def _solve_all_helper(self, solutions: set[Sudoku]) -> None:
-        if (empty_cell := self.find_empty()) is None:
+        ok, cell = self._propagate()
+        if not ok:
+            return
+        if cell is None:
             solutions.add(self)
             return
-        for candidate in self.candidates(*empty_cell):
-            (copy := Sudoku(self, _verify=False))[empty_cell] = candidate
+        row, col, free = cell
+        for candidate in _bits_of(free):
+            (copy := Sudoku._fast_copy(self))[row, col] = candidate
             copy._solve_all_helper(solutions)
 
     def has_solution(self) -> bool:
         """
         Checks if the Sudoku puzzle has at least one solution.
         """
-        return Sudoku(self, _verify=False).solve_inplace() is not None
+        return Sudoku._fast_copy(self).solve_inplace() is not None
 
     def is_unique(self) -> bool:
         """
         Checks if the Sudoku puzzle has exactly one solution.
         """
-        return self._is_unique_helper(set())
+        return Sudoku._fast_copy(self)._count_solutions(2) == 1
 
-    def _is_unique_helper(self, solutions: set[Sudoku]) -> bool:
-        if (empty_cell := self.find_empty()) is None:
-            solutions.add(self)
-            return len(solutions) == 1
-        for candidate in self.candidates(*empty_cell):
-            (copy := Sudoku(self, _verify=False))[empty_cell] = candidate
-            copy._solve_all_helper(solutions)
-            if len(solutions) > 1:
-                return False
-        return True
+    def _count_solutions(self, cap: int = 2) -> int:
+        """
+        Counts the solutions of the puzzle, stopping as soon as CAP are found.
+        The grid is filled in as far as propagation allows,
+        so this should be called on a copy.
+        """
+        ok, cell = self._propagate()
+        if not ok:
+            return 0
+        if cell is None:
+            return 1
+        row, col, free = cell
+        count = 0
+        for candidate in _bits_of(free):
+            (copy := Sudoku._fast_copy(self))[row, col] = candidate
+            count += copy._count_solutions(cap - count)
+            if count >= cap:
+                break
+        return count
 
     @classmethod
     def generate(
@@ -205,6 +510,7 @@ class Sudoku(Matrix[Unsigned]):
         """
         if grid is None:
             sudoku = cls.empty(n)
+            sudoku._seed_random()
         else:
             sudoku = cls(grid)
             if sudoku.find_empty() is not None:
@@ -213,15 +519,21 @@ class Sudoku(Matrix[Unsigned]):
 
         sudoku.solve_inplace()
 
-        for _ in range(k):
-            while True:
-                row, col = np.random.randint(0, n, size=2)  # type: ignore
-                if sudoku[row, col] != 0:
-                    break
-            sudoku[row, col] = 0
+        filled = np.flatnonzero(np.frombuffer(sudoku._buf, dtype=Unsigned))
+        for index in np.random.choice(filled, size=k, replace=False).tolist():
+            sudoku[divmod(index, sudoku.n)] = 0
 
         return sudoku
 
+    def _seed_random(self) -> None:
+        """
+        Fills the first row of an empty grid with a random permutation of the
+        digits, which cannot conflict with anything, so that the solver only
+        has to complete the remaining rows.
+        """
+        for col, digit in enumerate(np.random.permutation(self.n) + 1):
+            self[0, col] = digit
+
     @classmethod
     def generate_unique(
         cls,
@@ -229,63 +541,149 @@ class Sudoku(Matrix[Unsigned]):
         k: Int = 0,
         grid: Optional[Sequence[Sequence[Int]] | Matrix[NpInt]] = None,
         attempt_limit: Int = 1_000,
+        processes: Optional[Int] = None,
     ) -> Sudoku:
         """
         Generates a Sudoku puzzle with N×N size and K empty cells.
         It first randomly generates a puzzle, or takes in a complete grid,
         then removes K cells while ensuring that the puzzle has a unique solution.
+        By default the attempts run in the calling process.
+        If more than one process is asked for, the attempts are raced across
+        that many worker processes, which share the attempt limit;
+        scripts doing so need an ``if __name__ == "__main__":`` guard
+        on platforms that start workers by spawning, such as macOS and Windows.
         """
-        attempts = 0
-        while True:
-            attempts += 1
-            if attempts >= attempt_limit:
-                raise RuntimeError(
-                    f"Could not generate a unique Sudoku puzzle within {attempt_limit} attempts."
-                )
-            logger.info(f"Attempt {attempts}...")
-
+        if k == 0:
             sudoku = cls.generate(n, k, grid)
             logger.info(f"Generated Sudoku:\n{sudoku}")
+            logger.info("No empty cells, skipping uniqueness check...")
+            return sudoku
+
+        result: Optional[Sudoku] = None
+        if processes is None or processes <= 1:
+            attempts = itertools.count(1)
+            result = cls._generate_unique_attempts(
+                n, k, grid, attempt_limit, attempts.__next__, lambda: False
+            )
+        else:
+            shared_attempts = mp.Value("i", 0)
+            found = mp.Event()
+            with ProcessPoolExecutor(
+                int(processes),
+                initializer=_init_generate_unique_worker,
+                initargs=(shared_attempts, found),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _generate_unique_worker, cls, n, k, grid, attempt_limit, seed
+                    )
+                    for seed in np.random.randint(2**31, size=int(processes)).tolist()
+                ]
+                try:
+                    for future in as_completed(futures):
+                        if (result := future.result()) is not None:
+                            break
+                finally:
+                    found.set()
+
+        if result is None:
+            raise RuntimeError(
+                f"Could not generate a unique Sudoku puzzle within {attempt_limit} attempts."
+            )
+        return result
 
-            if k == 0:
-                logger.info("No empty cells, skipping uniqueness check...")
-                return sudoku
+    @classmethod
+    def _generate_unique_attempts(
+        cls,
+        n: Int,
+        k: Int,
+        grid: Optional[Sequence[Sequence[Int]] | Matrix[NpInt]],
+        attempt_limit: Int,
+        next_attempt: Callable[[], int],
+        stopped: Callable[[], bool],
+    ) -> Optional[Sudoku]:
+        """
+        Runs attempts for ``generate_unique`` until one of them succeeds,
+        the attempt limit is reached, or ``stopped`` returns ``True``.
+        """
+        while not stopped():
+            if (attempt := next_attempt()) >= attempt_limit:
+                break
+            logger.info(f"Attempt {attempt}...")
+
+            sudoku = cls.generate(n, k, grid)
+            logger.info(f"Generated Sudoku:\n{sudoku}")
 
             if sudoku.is_unique():
                 logger.info("Unique!")
                 return sudoku
             else:
                 logger.info("Not unique, trying again...")
+        return None
+
+    def __repr__(self) -> str:
+        name = type(self).__name__
+        grid = np.array2string(self.to_numpy(), separator=", ", prefix=name + "(")
+        return f"{name}({grid})"
 
     def __str__(self) -> str:
-        max_digit_length = len(str(self.n))
-        output = deque(
-            ("┏", "━" * (self.n * (max_digit_length + 1) + 2 * self.sr - 1), "┓\n")
-        )
-        for i in range(self.n):
-            output.append("┃")
-            for j in range(self.n):
-                output.append(f"{self[i, j]:>{max_digit_length + 1}}")
-                if (j + 1) % self.sr == 0 and j != self.n - 1:
-                    output.append(" │")
-            if (i + 1) % self.sr == 0 and i != self.n - 1:
-                output.extend(
-                    (
-                        " ┃\n┃",
-                        *(
-                            ("─" * (self.sr * (max_digit_length + 1) + 1), "┼")
-                            * (self.sr - 1)
-                        ),
-                        "─" * (self.sr * (max_digit_length + 1) + 1),
-                        "┃\n",
-                    )
-                )
-            else:
-                output.append(" ┃\n")
-        output.extend(
-            ("┗", "━" * (self.n * (max_digit_length + 1) + 2 * self.sr - 1), "┛")
-        )
-        return "".join(output)
+        n, sr = self.n, self.sr
+        width = len(str(n)) + 1
+        digits = [f"{digit:>{width}}" for digit in range(n + 1)]
+        border = "━" * (n * width + 2 * sr - 1)
+        rule = "┃" + "┼".join(("─" * (sr * width + 1),) * sr) + "┃\n"
+        rows = [
+            "┃"
+            + " │".join(
+                "".join(digits[digit] for digit in self._buf[i + j : i + j + sr])
+                for j in range(0, n, sr)
+            )
+            + " ┃\n"
+            for i in range(0, n * n, n)
+        ]
+        bands = ("".join(rows[i : i + sr]) for i in range(0, n, sr))
+        return "".join(("┏", border, "┓\n", rule.join(bands), "┗", border, "┛"))
+
+
+_worker_state: Optional[tuple[Synchronized[int], Event]] = None
+
+
+def _init_generate_unique_worker(attempts: Synchronized[int], found: Event) -> None:
+    """
+    Stores the attempt counter and the stop event shared by the worker
+    processes of ``Sudoku.generate_unique``.
+    """
+    global _worker_state
+    _worker_state = attempts, found
+
+
+def _generate_unique_worker(
+    cls: type[Sudoku],
+    n: Int,
+    k: Int,
+    grid: Optional[Sequence[Sequence[Int]] | Matrix[NpInt]],
+    attempt_limit: Int,
+    seed: int,
+) -> Optional[Sudoku]:
+    """
+    Runs attempts for ``Sudoku.generate_unique`` in a worker process,
+    stopping as soon as any worker has found a puzzle.
+    """
+    assert _worker_state is not None, "Worker was not initialised"
+    attempts, found = _worker_state
+
+    def next_attempt() -> int:
+        with attempts.get_lock():
+            attempts.value += 1
+            return attempts.value
+
+    np.random.seed(seed)
+    sudoku = cls._generate_unique_attempts(
+        n, k, grid, attempt_limit, next_attempt, found.is_set
+    )
+    if sudoku is not None:
+        found.set()
+    return sudoku
 
 
 __all__ = ["Sudoku"]
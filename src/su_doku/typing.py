@@ -1,15 +1,26 @@
 from numbers import Integral
 from typing import TypeVar
 
-from numpy import dtype, generic, integer, ndarray, uint8
+from numpy import dtype, generic, integer, ndarray, uint8, uint16, uint64
 
 _T = TypeVar("_T", bound=generic, covariant=True)
 
 PyInt = int | Integral
 NpInt = integer
 Unsigned = uint8
+CandMask = uint16
+WideCandMask = uint64
 Int = PyInt | NpInt
 Matrix = ndarray[tuple[int, int], dtype[_T]]
 Array = ndarray[tuple[int], dtype[_T]]
 
-__all__ = ["Array", "Int", "Matrix", "NpInt", "PyInt", "Unsigned"]
+__all__ = [
+    "Array",
+    "CandMask",
+    "Int",
+    "Matrix",
+    "NpInt",
+    "PyInt",
+    "Unsigned",
+    "WideCandMask",
+]